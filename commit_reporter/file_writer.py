@@ -1,23 +1,91 @@
 import datetime
 import os
+from pathlib import Path
+from typing import Iterable
 
+# Chunks are gathered into batches of roughly this many bytes, each written with
+# a single writev() call.
+WRITE_BUFFER_SIZE = 1024 * 1024
+# Fallback for the number of buffers accepted by one writev() call when the OS
+# does not report it (POSIX guarantees at least 16, Linux and macOS allow 1024).
+DEFAULT_IOV_MAX = 1024
 
-def create_run_directory(base_dir: str, repo_name: str) -> tuple[str, str]:
+
+def create_run_directory(base_dir: Path, repo_name: str) -> tuple[Path, str, bytes]:
     """
     Create a unique run directory under the given base directory using a
-    human-readable timestamp and repo name.
-    Returns the run directory path and the timestamp.
+    human-readable timestamp and repo name. A numeric suffix is appended when
+    another run already created a directory with the same name.
+    Returns the run directory path, the timestamp and the encoded report header
+    for that timestamp.
     """
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    run_dir = os.path.join(base_dir, f"run_{repo_name}_{timestamp}")
-    os.makedirs(run_dir, exist_ok=True)
-    return run_dir, timestamp
+    run_name = f"run_{repo_name}_{timestamp}"
+    run_dir = base_dir / run_name
+    suffix = 1
+    while True:
+        try:
+            # mkdir fails atomically if the directory exists, so concurrent
+            # runs never share (and overwrite) a run directory.
+            run_dir.mkdir(parents=True)
+            break
+        except FileExistsError:
+            suffix += 1
+            run_dir = base_dir / f"{run_name}_{suffix}"
+    header = f"Timestamp: {timestamp}\n{'=' * 80}\n\n".encode()
+    return run_dir, timestamp, header
+
+
+def _iov_max() -> int:
+    """
+    Return the maximum number of buffers the OS accepts in one writev() call.
+    """
+    try:
+        iov_max = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        return DEFAULT_IOV_MAX
+    return iov_max if iov_max > 0 else DEFAULT_IOV_MAX
 
 
-def write_file_with_metadata(file_path: str, header: str, content: str):
+def _write_all(fd: int, buffers: list[bytes]):
     """
-    Write content to a file preceded by a header.
+    Write all buffers to a file descriptor, resuming after partial writes.
     """
-    with open(file_path, "w") as f:
-        f.write(header)
-        f.write(content)
+    while buffers:
+        written = os.writev(fd, buffers)
+        index = 0
+        while index < len(buffers) and written >= len(buffers[index]):
+            written -= len(buffers[index])
+            index += 1
+        buffers = buffers[index:]
+        if buffers and written:
+            buffers[0] = buffers[0][written:]
+
+
+def write_file_with_metadata(file_path: Path, header: bytes, chunks: Iterable[str]):
+    """
+    Write content chunks to a file preceded by a header.
+    Chunks are consumed lazily, so generators are streamed straight to disk.
+    """
+    if not hasattr(os, "writev"):
+        # os.writev is POSIX-only; elsewhere write through a large file buffer.
+        with open(file_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(header)
+            f.writelines(chunk.encode() for chunk in chunks)
+        return
+
+    iov_max = _iov_max()
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        batch = [header]
+        batch_size = len(batch[0])
+        for chunk in chunks:
+            data = chunk.encode()
+            batch.append(data)
+            batch_size += len(data)
+            if batch_size >= WRITE_BUFFER_SIZE or len(batch) >= iov_max:
+                _write_all(fd, batch)
+                batch, batch_size = [], 0
+        _write_all(fd, batch)
+    finally:
+        os.close(fd)
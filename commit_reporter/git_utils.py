@@ -1,10 +1,50 @@
+import os
 import re
 import subprocess
-from dataclasses import dataclass, field
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import IO, Iterator, List, Optional
 
+# Read git's stdout in large blocks so parsing overlaps with git producing output.
+GIT_LOG_BUFFER_SIZE = 1024 * 1024
 
-@dataclass
+# git log -z separates commits with NUL and the format separates fields with the
+# ASCII unit separator, so messages containing " | " never need reassembling.
+RECORD_SEPARATOR = b"\x00"
+FIELD_SEPARATOR = b"\x1f"
+GIT_LOG_FORMAT = "%h%x1f%an%x1f%ad%x1f%s"
+
+# Commits by bots and automation, and trivial housekeeping commits, carry little
+# signal for a summary and only inflate the prompt.
+BOT_AUTHORS = frozenset(
+    {
+        "dependabot",
+        "dependabot-preview",
+        "renovate",
+        "renovate-bot",
+        "greenkeeper",
+        "github-actions",
+        "pre-commit-ci",
+        "snyk-bot",
+        "semantic-release-bot",
+        "allcontributors",
+        "imgbot",
+        "codecov",
+    }
+)
+BOT_KEYWORDS = ("dependabot", "renovate", "github-actions", "greenkeeper")
+BOT_SUFFIXES = ("[bot]", "-bot", "_bot", " bot")
+TRIVIAL_MESSAGE_PATTERN = re.compile(
+    r"^(Merge (branch|pull request)|Revert |bump version|update changelog)",
+    re.IGNORECASE,
+)
+
+# Directory scans are dominated by filesystem latency, so many threads overlap well.
+DISCOVERY_MAX_WORKERS = 32
+
+
+@dataclass(slots=True, frozen=True)
 class Commit:
     commit_hash: str
     author: str
@@ -12,40 +52,148 @@ class Commit:
     message: str
 
 
-@dataclass
-class Repository:
-    path: str
-    commits: List[Commit] = field(default_factory=list)
+def format_commit(commit: Commit) -> str:
+    """
+    Format a commit as a single report line.
+    """
+    return (
+        f"{commit.commit_hash} | {commit.author} "
+        f"| {commit.date} | {commit.message}\n"
+    )
+
+
+def _read_records(stream: IO[bytes], separator: bytes) -> Iterator[bytes]:
+    """
+    Lazily split a byte stream into records terminated by the given separator.
+    """
+    pending = b""
+    while chunk := stream.read1(GIT_LOG_BUFFER_SIZE):
+        records = (pending + chunk).split(separator)
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+
+@lru_cache(maxsize=1024)
+def _is_bot_author(author: str) -> bool:
+    """
+    Check whether an author name belongs to a bot or automation account.
+    Repositories have few distinct authors, so results are cached.
+    """
+    author = author.lower()
+    return (
+        author in BOT_AUTHORS
+        or author.endswith(BOT_SUFFIXES)
+        or any(keyword in author for keyword in BOT_KEYWORDS)
+    )
+
+
+def is_automated_commit(commit: Commit) -> bool:
+    """
+    Check whether a commit was made by a bot or is trivial merge, revert or
+    release housekeeping.
+    """
+    return _is_bot_author(commit.author) or bool(
+        TRIVIAL_MESSAGE_PATTERN.match(commit.message)
+    )
+
+
+def _decode(value: bytes) -> str:
+    """
+    Decode a raw git field, tolerating commits that are not valid UTF-8.
+    """
+    return value.decode("utf-8", "replace")
 
 
 def extract_commits(
     repo_path: str, authors: Optional[List[str]] = None
-) -> List[Commit]:
+) -> Iterator[Commit]:
     """
-    Extract commit logs from a Git repository.
-    Optionally filter commits by a list of author names.
+    Stream commit logs from a Git repository, yielding commits as git emits them.
+    Merge commits are never included. Optionally filter commits by a list of
+    author names.
     """
-    cmd = ["git", "-C", repo_path, "log", "--pretty=format:%h | %an | %ad | %s"]
+    cmd = [
+        "git",
+        "--no-pager",
+        "-c",
+        "log.showSignature=false",
+        "-C",
+        repo_path,
+        "log",
+        "--no-renames",
+        "--no-merges",
+        "-z",
+        f"--pretty=format:{GIT_LOG_FORMAT}",
+    ]
     if authors:
-        author_pattern = r"\|".join(re.escape(author) for author in authors)
-        cmd.extend(["--author", author_pattern])
+        # git ORs repeated --author filters; match them literally, not as regexes.
+        for author in authors:
+            cmd.extend(["--author", author])
+        cmd.append("--fixed-strings")
+
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=GIT_LOG_BUFFER_SIZE,
+        env={**os.environ, "GIT_PAGER": "cat", "PAGER": "cat"},
+    ) as proc:
+        # Repositories have few distinct authors, so decode each one only once
+        # and share the resulting string between commits.
+        author_cache: dict[bytes, str] = {}
+        for record in _read_records(proc.stdout, RECORD_SEPARATOR):
+            parts = record.split(FIELD_SEPARATOR, 3)
+            if len(parts) == 4:
+                commit_hash, author, date, message = parts
+                if author not in author_cache:
+                    author_cache[author] = _decode(author)
+                yield Commit(
+                    _decode(commit_hash),
+                    author_cache[author],
+                    _decode(date),
+                    _decode(message),
+                )
+        error_output = _decode(proc.stderr.read())
+        if proc.wait() != 0:
+            raise Exception(
+                f"Failed to extract commits for repo {repo_path}. Error: {error_output}"
+            )
+
+
+def _scan_directory(path: str) -> tuple[str, bool, list[str]]:
+    """
+    Check whether a directory is a Git repository and, if not, list its
+    subdirectories to search next.
+    """
+    if os.path.isdir(os.path.join(path, ".git")):
+        return path, True, []
     try:
-        output = subprocess.check_output(
-            cmd, universal_newlines=True, stderr=subprocess.STDOUT
-        )
-    except subprocess.CalledProcessError as e:
-        raise Exception(
-            f"Failed to extract commits for repo {repo_path}. Error: {e.output}"
-        )
-
-    commits = []
-    if output:
-        for line in output.splitlines():
-            parts = line.split(" | ")
-            if len(parts) >= 4:
-                commit_hash = parts[0]
-                author = parts[1]
-                date = parts[2]
-                message = " | ".join(parts[3:])
-                commits.append(Commit(commit_hash, author, date, message))
-    return commits
+        with os.scandir(path) as entries:
+            subdirs = [
+                entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        subdirs = []
+    return path, False, subdirs
+
+
+def find_git_repos(root: str) -> List[str]:
+    """
+    Find Git repositories under the given directory, scanning directories
+    concurrently. Repositories are not searched for nested repositories.
+    """
+    repo_paths = []
+    with ThreadPoolExecutor(max_workers=DISCOVERY_MAX_WORKERS) as executor:
+        pending = {executor.submit(_scan_directory, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, is_repo, subdirs = future.result()
+                if is_repo:
+                    repo_paths.append(path)
+                pending.update(
+                    executor.submit(_scan_directory, subdir) for subdir in subdirs
+                )
+    return sorted(repo_paths)
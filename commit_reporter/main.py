@@ -1,20 +1,196 @@
+import asyncio
 import logging
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 import typer
 
 from .file_writer import create_run_directory, write_file_with_metadata
-from .git_utils import Repository, extract_commits
+from .git_utils import (
+    Commit,
+    extract_commits,
+    find_git_repos,
+    format_commit,
+    is_automated_commit,
+)
 from .settings import settings
 from .summariser import summarise_commits
 
 app = typer.Typer()
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+# Flush output per line so progress shows up promptly when redirected to a file.
+sys.stdout.reconfigure(line_buffering=True)
+sys.stderr.reconfigure(line_buffering=True)
+
+# Log extraction progress every this many commits.
+PROGRESS_INTERVAL = 10_000
+
+
+def _log_progress(commits: Iterable[Commit], repo_path: str) -> Iterator[Commit]:
+    """
+    Pass commits through, periodically logging how many have been extracted.
+    """
+    count = 0
+    for count, commit in enumerate(commits, start=1):
+        if count % PROGRESS_INTERVAL == 0:
+            logging.info(f"Extracted {count} commits from {repo_path}")
+        yield commit
+    logging.info(f"Extracted {count} commits from {repo_path}")
+
+
+def _tee(
+    commits: Iterable[Commit], sink: list[Commit], exclude_bots: bool
+) -> Iterator[Commit]:
+    """
+    Pass commits through while also collecting them into sink, leaving out
+    automated commits from the sink when exclude_bots is set.
+    """
+    for commit in commits:
+        if not (exclude_bots and is_automated_commit(commit)):
+            sink.append(commit)
+        yield commit
+
+
+def process_repository(
+    repo_path: str,
+    authors: Optional[list[str]],
+    summarise: bool,
+    write_info: bool = True,
+    exclude_bots: bool = True,
+    output_name: Optional[str] = None,
+    summary_concurrency: Optional[int] = None,
+) -> None:
+    """
+    Write the commit logs of a single Git repository to a new run directory and
+    optionally summarise them. Reports go under base_output_dir/output_name,
+    which defaults to the repository name. Unless exclude_bots is False, commits
+    by bots and trivial housekeeping commits are left out of the summary (the
+    commit info report always lists every commit). summary_concurrency caps the
+    summary requests in flight (summary_max_concurrency by default).
+    """
+    commits: Iterator[Commit] = _log_progress(
+        extract_commits(repo_path, authors), repo_path
+    )
+    # Pull the first commit before creating any output, so git failures (such as
+    # a repository without commits) leave no empty report behind.
+    first_commit = next(commits, None)
+    if first_commit is not None:
+        commits = chain([first_commit], commits)
+
+    repo_name = Path(repo_path).resolve().name
+
+    # Define the base output directory: reports/<repo_name>
+    base_dir = Path.cwd() / settings.base_output_dir / (output_name or repo_name)
+    base_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create a unique run directory that includes the repo name and a
+    # human-readable timestamp.
+    run_dir, timestamp, header_info = create_run_directory(base_dir, repo_name)
+
+    summary_commits: list[Commit] = []
+    if summarise:
+        # Collect commits for the prompt as they stream to disk, so writing does
+        # not wait for git to finish.
+        commits = _tee(commits, summary_commits, exclude_bots)
+
+    if write_info:
+
+        # Define commit info file name (without model details).
+        commit_info_file = run_dir / f"commit_info_{timestamp}_{repo_name}.txt"
+        # Format commit lines lazily so they stream from git straight to disk.
+        commit_info_chunks = chain(
+            [f"Repository: {repo_path}\n"], map(format_commit, commits), ["\n"]
+        )
+        write_file_with_metadata(commit_info_file, header_info, commit_info_chunks)
+        logging.info(f"Commit logs written to {commit_info_file}")
+    else:
+        # Nothing to write; drain the stream to collect the commits to summarise.
+        for _ in commits:
+            pass
+
+    if summarise:
+        summary = asyncio.run(
+            summarise_commits(
+                summary_commits, repo_path, max_concurrency=summary_concurrency
+            )
+        )
+        # Define commit summary file name (include model details).
+        commit_summary_file = (
+            run_dir
+            / f"commit_summary_{timestamp}_{repo_name}_{settings.model_used}.txt"
+        )
+        header_summary = (
+            f"Timestamp: {timestamp}\n"
+            f"Model Used: {settings.model_used}\n"
+            "Prompt Used:\n"
+            f"{settings.system_prompt}\n\n{settings.user_prompt}\n" + "=" * 80 + "\n\n"
+        ).encode()
+        write_file_with_metadata(commit_summary_file, header_summary, [summary])
+        logging.info(f"Commit summary written to {commit_summary_file}")
+
+
+def _relative_output_name(root: str, repo_path: str) -> Optional[str]:
+    """
+    Name a repository's reports by its path relative to the search root, falling
+    back to the repository name when the root is the repository itself.
+    """
+    relative_path = os.path.relpath(repo_path, root)
+    return None if relative_path == os.curdir else relative_path
+
+
+def process_directories(
+    root: str,
+    repo_paths: list[str],
+    authors: Optional[list[str]],
+    summarise: bool,
+    write_info: bool = True,
+    exclude_bots: bool = True,
+) -> None:
+    """
+    Process several Git repositories found under root concurrently, one worker
+    process each. Reports are stored by path relative to root, so repositories
+    sharing a name do not overwrite each other. A failing repository is logged
+    without interrupting the others.
+    """
+    total = len(repo_paths)
+    max_workers = min(total, os.cpu_count() or 1)
+    # Share the summary request budget between workers, so running them in
+    # parallel does not multiply the requests in flight against the API.
+    summary_concurrency = max(1, settings.summary_max_concurrency // max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                process_repository,
+                path,
+                authors,
+                summarise,
+                write_info,
+                exclude_bots,
+                _relative_output_name(root, path),
+                summary_concurrency,
+            ): path
+            for path in repo_paths
+        }
+        for processed, future in enumerate(as_completed(futures), start=1):
+            repo_path = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Failed to process repo {repo_path}: {e}")
+            logging.info(f"Processed {processed}/{total} repos ({repo_path})")
 
 
 @app.command()
 def main(
-    repository: str = typer.Argument(..., help="Path to the Git repository."),
+    repository: str = typer.Argument(
+        ...,
+        help="Path to the Git repository, or the directory to search with "
+        "--recursive.",
+    ),
     authors: list[str] = typer.Option(
         None,
         "--author",
@@ -27,65 +203,56 @@ def main(
         "-s",
         help="Summarise the extracted commit logs using OpenAI.",
     ),
+    write_info: bool = typer.Option(
+        True,
+        "--info/--no-info",
+        help="Write the extracted commit logs to a file (use --no-info with "
+        "--summarise to only write the summary).",
+    ),
+    include_bots: bool = typer.Option(
+        False,
+        "--include-bots",
+        help="Also summarise commits by bots and trivial merge, revert and "
+        "release housekeeping commits (the commit info report always lists "
+        "every commit).",
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Report on every Git repository found under the given directory.",
+    ),
 ):
     """
     Extract commit logs from the specified Git repository and optionally summarise them.
     """
+    if not write_info and not summarise:
+        typer.echo("Nothing to do: --no-info requires --summarise.")
+        raise typer.Exit()
+
+    if recursive:
+        repo_paths = find_git_repos(repository)
+        if not repo_paths:
+            typer.echo(f"No Git repositories found under '{repository}'.")
+            raise typer.Exit()
+        process_directories(
+            repository, repo_paths, authors, summarise, write_info, not include_bots
+        )
+        return
+
     repo_path = repository
-    if not os.path.isdir(os.path.join(repo_path, ".git")):
+    if not (Path(repo_path) / ".git").is_dir():
         typer.echo(
             f"The directory '{repo_path}' does not appear to be a Git repository."
         )
         raise typer.Exit()
 
     try:
-        commits = extract_commits(repo_path, authors)
+        process_repository(repo_path, authors, summarise, write_info, not include_bots)
     except Exception as e:
-        typer.echo(f"Error extracting commits: {e}")
+        typer.echo(f"Error processing repository: {e}")
         raise typer.Exit()
 
-    repository_obj = Repository(path=repo_path, commits=commits)
-    repo_name = os.path.basename(os.path.abspath(repo_path))
-
-    # Define the base output directory: reports/<repo_name>
-    base_dir = os.path.join(os.getcwd(), settings.base_output_dir, repo_name)
-    os.makedirs(base_dir, exist_ok=True)
-
-    # Create a unique run directory that includes the repo name and a
-    # human-readable timestamp.
-    run_dir, timestamp = create_run_directory(base_dir, repo_name)
-
-    # Construct commit info content.
-    commit_info_content = f"Repository: {repo_path}\n"
-    for commit in repository_obj.commits:
-        commit_info_content += (
-            f"{commit.commit_hash} | {commit.author} "
-            f"| {commit.date} | {commit.message}\n"
-        )
-    commit_info_content += "\n"
-
-    # Define commit info file name (without model details).
-    commit_info_file = os.path.join(run_dir, f"commit_info_{timestamp}_{repo_name}.txt")
-    header_info = f"Timestamp: {timestamp}\n" + "=" * 80 + "\n\n"
-    write_file_with_metadata(commit_info_file, header_info, commit_info_content)
-    logging.info(f"Commit logs written to {commit_info_file}")
-
-    if summarise:
-        commit_text = commit_info_content
-        summary = summarise_commits(commit_text)
-        # Define commit summary file name (include model details).
-        commit_summary_file = os.path.join(
-            run_dir, f"commit_summary_{timestamp}_{repo_name}_{settings.model_used}.txt"
-        )
-        header_summary = (
-            f"Timestamp: {timestamp}\n"
-            f"Model Used: {settings.model_used}\n"
-            "Prompt Used:\n"
-            f"{settings.system_prompt}\n\n{settings.user_prompt}\n" + "=" * 80 + "\n\n"
-        )
-        write_file_with_metadata(commit_summary_file, header_summary, summary)
-        logging.info(f"Commit summary written to {commit_summary_file}")
-
 
 if __name__ == "__main__":
     app()
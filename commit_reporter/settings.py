@@ -22,6 +22,17 @@ class Settings(BaseSettings):
         "list of key changes, highlighting new features, bug fixes, "
         "refactorings, and any breaking changes."
     )
+    reduce_prompt: str = (
+        "The following are summaries of consecutive batches of commit logs "
+        "from the same run:\n\n{summaries}\n\n"
+        "Combine them into a single summary with an overall overview and a "
+        "bullet-point list of key changes, highlighting new features, bug fixes, "
+        "refactorings, and any breaking changes."
+    )
+    # Commit logs larger than this many characters (~8k tokens) are summarised
+    # in batches which are then combined into one summary.
+    summary_chunk_size: int = 32_000
+    summary_max_concurrency: int = 32
 
     class Config:
         env_file = ".env"
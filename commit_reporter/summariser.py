@@ -1,32 +1,158 @@
+import asyncio
+import importlib.util
+import io
 import logging
+from typing import Iterable, Iterator, Optional
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
+from .git_utils import Commit, format_commit
 from .settings import settings
 
 
-def summarise_commits(
-    commit_text: str, client=OpenAI(api_key=settings.openai_api_key)
+def _create_client(concurrency: int) -> AsyncOpenAI:
+    """
+    Build an OpenAI client for a single summarisation run.
+    The connection pool is sized so every concurrent chunk request can reuse a
+    kept-alive connection, multiplexed over HTTP/2 when h2 is installed.
+    """
+    http_client = DefaultAsyncHttpxClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
+    )
+    return AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
+
+
+def _chunk_commits(
+    commits: Iterable[Commit], repo_path: str, chunk_size: int
+) -> Iterator[str]:
+    """
+    Format commits into chunks of commit log text of at most chunk_size
+    characters, each headed by the repository path (a single overlong commit
+    forms its own chunk).
+    """
+    header = f"Repository: {repo_path}\n"
+    buffer = io.StringIO(header)
+    buffer.seek(len(header))
+    for commit in commits:
+        line = format_commit(commit)
+        if buffer.tell() > len(header) and buffer.tell() + len(line) > chunk_size:
+            yield buffer.getvalue()
+            buffer = io.StringIO(header)
+            buffer.seek(len(header))
+        buffer.write(line)
+    yield buffer.getvalue()
+
+
+async def _complete(
+    client: AsyncOpenAI, semaphore: asyncio.Semaphore, prompt: str
 ) -> str:
     """
-    Query an OpenAI model to summarise the essential points from commit logs.
+    Run a single chat completion for the given user prompt.
     """
-    client.api_key = settings.openai_api_key
-    try:
-        response = client.chat.completions.create(
+    async with semaphore:
+        response = await client.chat.completions.create(
             model=settings.model_used,
             messages=[
                 {"role": "system", "content": settings.system_prompt},
-                {
-                    "role": "user",
-                    "content": settings.user_prompt.format(commit_text=commit_text),
-                },
+                {"role": "user", "content": prompt},
             ],
             temperature=0.5,
             max_tokens=500,
         )
-        summary = response.choices[0].message.content
-        return summary
+    return response.choices[0].message.content
+
+
+def _batch_summaries(summaries: list[str], batch_size: int) -> list[list[str]]:
+    """
+    Group summaries into batches of at most batch_size characters. Every batch
+    but the last holds at least two summaries, so each reduce round shrinks the
+    number of summaries.
+    """
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_size = 0
+    for summary in summaries:
+        if len(current) >= 2 and current_size + len(summary) > batch_size:
+            batches.append(current)
+            current, current_size = [], 0
+        current.append(summary)
+        # Account for the blank line joining summaries in the reduce prompt.
+        current_size += len(summary) + 2
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _reduce(
+    client: AsyncOpenAI, semaphore: asyncio.Semaphore, summaries: list[str]
+) -> str:
+    """
+    Combine a batch of partial summaries into one summary.
+    """
+    if len(summaries) == 1:
+        return summaries[0]
+    return await _complete(
+        client,
+        semaphore,
+        settings.reduce_prompt.replace("{summaries}", "\n\n".join(summaries)),
+    )
+
+
+async def _summarise(
+    client: AsyncOpenAI, commits: Iterable[Commit], repo_path: str, concurrency: int
+) -> str:
+    """
+    Summarise commits chunk by chunk, then combine the partial summaries.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    # Substitute with str.replace so each chunk is copied into the prompt once.
+    summaries = await asyncio.gather(
+        *(
+            _complete(
+                client,
+                semaphore,
+                settings.user_prompt.replace("{commit_text}", chunk),
+            )
+            for chunk in _chunk_commits(commits, repo_path, settings.summary_chunk_size)
+        )
+    )
+    # Combine partial summaries in rounds of bounded size until one remains.
+    while len(summaries) > 1:
+        summaries = await asyncio.gather(
+            *(
+                _reduce(client, semaphore, batch)
+                for batch in _batch_summaries(summaries, settings.summary_chunk_size)
+            )
+        )
+    return summaries[0]
+
+
+async def summarise_commits(
+    commits: Iterable[Commit],
+    repo_path: str,
+    client: Optional[AsyncOpenAI] = None,
+    max_concurrency: Optional[int] = None,
+) -> str:
+    """
+    Query an OpenAI model to summarise the essential points from commit logs.
+    Large logs are summarised chunk by chunk concurrently, with at most
+    max_concurrency requests in flight (summary_max_concurrency by default),
+    then the partial summaries are combined in rounds of bounded size until one
+    remains.
+    """
+    concurrency = max_concurrency or settings.summary_max_concurrency
+    try:
+        if client is not None:
+            return await _summarise(client, commits, repo_path, concurrency)
+        # The client's connection pool is bound to the running event loop, so
+        # it is created and closed per call rather than shared between
+        # asyncio.run() calls.
+        async with _create_client(concurrency) as client:
+            return await _summarise(client, commits, repo_path, concurrency)
     except Exception as e:
         logging.error(f"Failed to summarise commit logs: {e}")
         return "Summary unavailable."